@@ -2,10 +2,10 @@
 Defines base constant and base container for constants.
 
 """
+import functools
+import sys
 import types
 
-from collections import OrderedDict as odict
-
 from .exceptions import CandvConstantAlreadyBoundError
 from .exceptions import CandvContainerMisusedError
 from .exceptions import CandvInvalidConstantClass
@@ -27,19 +27,41 @@ class SimpleConstant:
     constant's name: set up automatically and is equal to the name of the
     container's attribute
 
+  :ivar str full_name:
+    constant's name prefixed by the full name of its container: set up
+    automatically, read-only
+
+  .. versionchanged:: 1.6.0
+     Defines ``__slots__``. Subclasses which do not define ``__slots__``
+     still get ``__dict__`` for arbitrary attributes.
+
   """
+  __slots__ = ('name', 'container', '_full_name', '_repr', '__weakref__', )
 
   def __init__(self):
     self.name = None
     self.container = None
+    self._update_full_name()
 
   def _post_init(self, name, container=None):
     """
     Called automatically by the container after container's class construction.
 
     """
-    self.name = name
+    self.name = sys.intern(name)
     self.container = container
+    self._update_full_name()
+
+  def _update_full_name(self):
+    # name and container do not change after binding, so the full name and
+    # repr are computed once instead of on each access, hashing or comparison
+    prefix = (
+      self.container.full_name
+      if self.container is not None
+      else UNBOUND_CONSTANT_CONTAINER_NAME
+    )
+    self._full_name = sys.intern(f"{prefix}.{self.name}")
+    self._repr = f"<constant '{self._full_name}'>"
 
   def to_group(self, group_class, **group_members):
     """
@@ -95,12 +117,7 @@ class SimpleConstant:
 
   @property
   def full_name(self):
-    prefix = (
-      self.container.full_name
-      if self.container
-      else UNBOUND_CONSTANT_CONTAINER_NAME
-    )
-    return f"{prefix}.{self.name}"
+    return self._full_name
 
   def to_primitive(self, *args, **kwargs):
     """
@@ -121,22 +138,28 @@ class SimpleConstant:
     Produce a text identifying the constant.
 
     """
-    return f"<constant '{self.full_name}'>"
+    return self._repr
 
   def __hash__(self):
     """
     .. versionadded:: 1.3.1
     """
-    return hash(self.full_name)
+    return hash(self._full_name)
 
   def __eq__(self, other):
     """
+    .. versionchanged:: 1.6.0
+       ``NotImplemented`` is returned for objects which are not constants.
+
     .. versionadded:: 1.3.1
     """
-    return (
-      isinstance(other, SimpleConstant)
-      and (self.full_name == other.full_name)
-    )
+    if self is other:
+      return True
+
+    if not isinstance(other, SimpleConstant):
+      return NotImplemented
+
+    return self._full_name == other._full_name
 
   def __ne__(self, other):
     """
@@ -144,8 +167,32 @@ class SimpleConstant:
     """
     return not (self == other)
 
+  def __reduce_ex__(self, protocol):
+    """
+    Pickle bound constants by reference to their containers, so unpickling
+    returns the very same constant.
+
+    .. versionadded:: 1.6.0
+
+    """
+    if self.container is None:
+      return super().__reduce_ex__(protocol)
+
+    return (getattr, (self.container, self.name))
+
+  def __getstate__(self):
+    # pickle protocols 0 and 1 and Python versions below 3.11 do not collect
+    # values of slots on their own
+    slots = {
+      name: getattr(self, name)
+      for name in SimpleConstant.__slots__
+      if name != '__weakref__' and hasattr(self, name)
+    }
+    return (getattr(self, '__dict__', None), slots)
+
 
 class _LazyConstantsGroup:
+  __slots__ = ('constant', 'group_class', 'group_members', )
 
   def __init__(self, constant, group_class, **group_members):
     self._validate_group_members(group_members)
@@ -165,14 +212,18 @@ class _LazyConstantsGroup:
   def _evaluate(self, parent, name):
     full_name = f"{parent.full_name}.{name}"
     group_bases = (self.group_class, )
-    self.group_members.update({
+    group_attributes = {
+      **self.group_members,
       'name': name,
       'full_name': full_name,
       'container': parent,
       '__repr': f"<constants group '{full_name}'>",
-    })
+      # let groups be pickled by reference like regular containers
+      '__module__': parent.__module__,
+      '__qualname__': f"{parent.__qualname__}.{name}",
+    }
 
-    group = type(full_name, group_bases, self.group_members)
+    group = type(full_name, group_bases, group_attributes)
     group.to_primitive = self._make_to_primitive(group, self.constant)
     self.constant.merge_into_group(group)
 
@@ -196,6 +247,10 @@ class _LazyConstantsGroup:
     return types.MethodType(to_primitive, group)
 
 
+#: Types of class attributes which can become members of containers.
+_MEMBER_TYPES = (SimpleConstant, _LazyConstantsGroup, )
+
+
 class _ConstantsContainerMeta(type):
   """
   Metaclass for creating container classes for constants.
@@ -214,6 +269,11 @@ class _ConstantsContainerMeta(type):
 
     cls._members = self._make_members_from_attributes(cls, attributes)
 
+    # members are immutable after class construction, so cache them once
+    cls._names = tuple(cls._members.keys())
+    cls._constants = tuple(cls._members.values())
+    cls._items = tuple(cls._members.items())
+
     return cls
 
   @staticmethod
@@ -244,24 +304,29 @@ class _ConstantsContainerMeta(type):
   @classmethod
   def _make_members_from_attributes(cls, target_cls, attributes):
     members = []
+    constant_class = target_cls.constant_class
 
     for name, the_object in attributes.items():
+      if not isinstance(the_object, _MEMBER_TYPES):
+        # most attributes are methods and other regular class attributes
+        continue
+
       if isinstance(the_object, _LazyConstantsGroup):
         group = the_object._evaluate(target_cls, name)
         setattr(target_cls, name, group)
         members.append((name, group))
 
-      elif isinstance(the_object, target_cls.constant_class):
+      elif isinstance(the_object, constant_class):
         cls._validate_constant_is_not_bound(target_cls, name, the_object)
         the_object._post_init(name=name, container=target_cls)
         members.append((name, the_object))
 
-      elif isinstance(the_object, SimpleConstant):
+      else:
         # init but do not append constants which are more generic
         # than ``constant_class``
         the_object._post_init(name=name)
 
-    return odict(members)
+    return dict(members)
 
   @staticmethod
   def _validate_constant_is_not_bound(target_cls, attribute_name, the_object):
@@ -318,7 +383,7 @@ class _ConstantsContainerMeta(type):
     return len(self._members)
 
   def __iter__(self):
-    return self.iternames()
+    return iter(self._names)
 
   def get(self, name, default=None):
     """
@@ -370,7 +435,7 @@ class _ConstantsContainerMeta(type):
     :rtype: :class:`bool`
 
     """
-    return name in self
+    return name in self._members
 
   def names(self):
     """
@@ -397,7 +462,7 @@ class _ConstantsContainerMeta(type):
       ['foo', 'bar']
 
     """
-    return list(self._members.keys())
+    return list(self._names)
 
   def iternames(self):
     """
@@ -406,7 +471,7 @@ class _ConstantsContainerMeta(type):
     Same as :meth:`names`, but returns an interator.
 
     """
-    return iter(self._members.keys())
+    return iter(self._names)
 
   def constants(self):
     """
@@ -433,7 +498,7 @@ class _ConstantsContainerMeta(type):
       ['foo', 'bar']
 
     """
-    return list(self._members.values())
+    return list(self._constants)
 
   def iterconstants(self):
     """
@@ -442,7 +507,7 @@ class _ConstantsContainerMeta(type):
     Same as :meth:`constants`, but returns an interator
 
     """
-    return iter(self._members.values())
+    return iter(self._constants)
 
   def items(self):
     """
@@ -470,7 +535,7 @@ class _ConstantsContainerMeta(type):
       [('foo', <constant 'FOO.foo'>), ('bar', <constant 'FOO.bar'>)]
 
     """
-    return list(self._members.items())
+    return list(self._items)
 
   def iteritems(self):
     """
@@ -479,7 +544,7 @@ class _ConstantsContainerMeta(type):
     Same as :meth:`items`, but returns an interator
 
     """
-    return iter(self._members.items())
+    return iter(self._items)
 
   #: .. versionadded:: 1.1.2
   #:
@@ -507,7 +572,7 @@ class _ConstantsContainerMeta(type):
     """
     items = [
       x.to_primitive(*args, **kwargs)
-      for x in self.iterconstants()
+      for x in self._constants
     ]
     return {
       'name': self.name,
@@ -546,6 +611,7 @@ class Constants(metaclass=_ConstantsContainerMeta):
 
 
 @export
+@functools.lru_cache(maxsize=None)
 def with_constant_class(the_class):
   """
   Create a mixin class with ``constant_class`` attribute.
@@ -572,6 +638,9 @@ def with_constant_class(the_class):
     >>> FOO.constant_class
     <class '__main__.CustomConstant'>
 
+  .. versionchanged:: 1.6.0
+     Mixins are cached: calls with the same class return the same mixin.
+
   """
   class ConstantsMixin:
     constant_class = the_class
@@ -2,6 +2,7 @@
 Provides extra ready-to-use classes for constructing custom constants.
 
 """
+import datetime
 import operator
 
 from .core import Constants
@@ -12,6 +13,30 @@ from .exceptions import CandvValueNotFoundError
 from ._utils import export
 
 
+#: Marks absence of an optional argument for which ``None`` is a valid value.
+_MISSING = object()
+
+_get_value = operator.attrgetter("value")
+
+#: Types of values which are primitives by themselves.
+#: Exact types are expected: subclasses may redefine conversion to primitives.
+_PRIMITIVE_TYPES = frozenset([
+  type(None),
+  bool,
+  int,
+  float,
+  str,
+])
+
+#: Converters of values of well-known types into primitives.
+#: Exact types are expected as well.
+_PRIMITIVE_CONVERTERS = {
+  datetime.date: datetime.date.isoformat,
+  datetime.datetime: datetime.datetime.isoformat,
+  datetime.time: datetime.time.isoformat,
+}
+
+
 @export
 class VerboseMixin:
   """
@@ -44,14 +69,16 @@ class VerboseMixin:
         )
 
   """
-  def __init__(self, *args, **kwargs):
-    self.verbose_name = kwargs.pop('verbose_name', None)
-    self.help_text = kwargs.pop('help_text', None)
+  __slots__ = ()
+
+  def __init__(self, *args, verbose_name=None, help_text=None, **kwargs):
+    self.verbose_name = verbose_name
+    self.help_text = help_text
     super().__init__(*args, **kwargs)
 
   def merge_into_group(self, group):
     """
-    Overrides :meth:`~candv.base.Constant.merge_into_group` to add
+    Overrides :meth:`~candv.SimpleConstant.merge_into_group` to add
     ``verbose_name`` with ``help_text`` attributes to the target group.
 
     """
@@ -68,18 +95,21 @@ class VerboseMixin:
 
     """
     primitive = super().to_primitive(*args, **kwargs)
-    primitive.update({
-      'verbose_name': (
-        str(self.verbose_name)
-        if self.verbose_name is not None
-        else None
-      ),
-      'help_text': (
-        str(self.help_text)
-        if self.help_text is not None
-        else None
-      ),
-    })
+
+    verbose_name = self.verbose_name
+    primitive['verbose_name'] = (
+      str(verbose_name)
+      if verbose_name is not None
+      else None
+    )
+
+    help_text = self.help_text
+    primitive['help_text'] = (
+      str(help_text)
+      if help_text is not None
+      else None
+    )
+
     return primitive
 
 
@@ -95,6 +125,7 @@ class VerboseConstant(VerboseMixin, SimpleConstant):
   :ivar str help_text: verbose description of the constant. Default: ``None``
 
   """
+
   def __init__(self, verbose_name=None, help_text=None):
     super().__init__(verbose_name=verbose_name, help_text=help_text)
 
@@ -108,13 +139,14 @@ class ValueConstant(SimpleConstant):
   :ivar value: constant's value
 
   """
+
   def __init__(self, value):
     super().__init__()
     self.value = value
 
   def merge_into_group(self, group):
     """
-    Redefines :meth:`~candv.base.Constant.merge_into_group` and adds ``value``
+    Redefines :meth:`~candv.SimpleConstant.merge_into_group` and adds ``value``
     attribute to the target group.
 
     """
@@ -131,15 +163,20 @@ class ValueConstant(SimpleConstant):
     """
     primitive = super().to_primitive(*args, **kwargs)
     value = self.value
+    value_type = type(value)
+
+    if value_type in _PRIMITIVE_CONVERTERS:
+      value = _PRIMITIVE_CONVERTERS[value_type](value)
 
-    if hasattr(value, "isoformat"):
-      value = value.isoformat()
+    elif value_type not in _PRIMITIVE_TYPES:
+      if hasattr(value, "isoformat"):
+        value = value.isoformat()
 
-    if hasattr(value, "to_primitive"):
-      value = value.to_primitive(*args, **kwargs)
+      if hasattr(value, "to_primitive"):
+        value = value.to_primitive(*args, **kwargs)
 
-    elif callable(value):
-      value = value()
+      elif callable(value):
+        value = value()
 
     primitive['value'] = value
     return primitive
@@ -159,6 +196,7 @@ class VerboseValueConstant(VerboseMixin, ValueConstant):
   :ivar str help_text: verbose description of the constant. Default: ``None``
 
   """
+
   def __init__(self, value, verbose_name=None, help_text=None):
     super().__init__(value, verbose_name=verbose_name, help_text=help_text)
 
@@ -175,24 +213,35 @@ class Values(Constants):
   constant_class = ValueConstant
 
   @classmethod
-  def get_by_value(cls, value):
+  def get_by_value(cls, value, default=_MISSING):
     """
     Get a constant by its value.
 
     :param value: value of the constant to look for
 
-    :returns: first found constant with given value
+    :param default:
+      an optional object returned if no constant in container has given value.
+      Allows to avoid handling of exceptions if missing values are expected
 
-    :raises CandvValueNotFoundError: if no constant in container has given value
+    :returns: first found constant with given value or ``default`` value
+
+    :raises CandvValueNotFoundError:
+      if no constant in container has given value and ``default`` is not
+      specified
+
+    .. versionchanged:: 1.6.0
+       The ``default`` param is added.
 
     """
-    for constant in cls.iterconstants():
-      if constant.value == value:
+    for constant in cls._constants:
+      if constant.value is value or constant.value == value:
         return constant
 
+    if default is not _MISSING:
+      return default
+
     raise CandvValueNotFoundError(
-      "constant with value \"{0}\" is not present in \"{1}\""
-      .format(value, cls)
+      f'constant with value "{value}" is not present in "{cls}"'
     )
 
   @classmethod
@@ -204,13 +253,11 @@ class Values(Constants):
     :returns: list of all found constants with given value
 
     """
-    constants = []
-
-    for constant in cls.iterconstants():
-      if constant.value == value:
-        constants.append(constant)
-
-    return constants
+    return [
+      constant
+      for constant in cls._constants
+      if constant.value is value or constant.value == value
+    ]
 
   @classmethod
   def values(cls):
@@ -239,13 +286,10 @@ class Values(Constants):
 
     .. note::
 
-      Overrides :meth:`~candv.base.ConstantsContainer.values` since 1.1.2.
+      Overrides :meth:`~candv.Constants.values` since 1.1.2.
 
     """
-    return [
-      x.value
-      for x in cls.iterconstants()
-    ]
+    return list(map(_get_value, cls._constants))
 
   @classmethod
   def itervalues(cls):
@@ -256,7 +300,7 @@ class Values(Constants):
 
     .. note::
 
-      Overrides :meth:`~candv.base.ConstantsContainer.itervalues` since 1.1.2.
+      Overrides :meth:`~candv.Constants.itervalues` since 1.1.2.
 
     """
-    return map(operator.attrgetter("value"), cls.iterconstants())
+    return map(_get_value, cls._constants)
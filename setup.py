@@ -4,8 +4,10 @@ import sys
 
 if sys.version_info >= (3, 9):
   List  = list
+  Set   = set
 else:
   from typing import List
+  from typing import Set
 
 from pathlib import Path
 from setuptools import setup
@@ -37,30 +39,40 @@ def maybe_get_current_commit_hash() -> Optional[str]:
   return maybe_get_shell_output("git rev-parse --short HEAD")
 
 
-def parse_requirements(file_path: Path) -> List[str]:
+def parse_requirements(
+  file_path: Path,
+  seen: Optional[Set[Path]] = None,
+) -> List[str]:
   requirements = list()
 
-  if not file_path.exists():
+  if seen is None:
+    seen = set()
+
+  file_path = file_path.resolve()
+
+  # check if the file is missing or was already included
+  if file_path in seen or not file_path.exists():
     return requirements
 
-  with file_path.open("rt") as f:
-    for line in f:
-      line = line.strip()
+  seen.add(file_path)
+
+  for line in file_path.read_text().splitlines():
+    line = line.strip()
 
-      # check if comment or empty
-      if not line or line.startswith("#"):
-        continue
+    # check if comment or empty
+    if not line or line.startswith("#"):
+      continue
 
-      # check if is inclusion of other requirements file
-      elif line.startswith("-r"):
-        name = Path(line.split(" ", 1)[1])
-        path = file_path.parent / name
-        subrequirements = parse_requirements(path)
-        requirements.extend(subrequirements)
+    # check if is inclusion of other requirements file
+    elif line.startswith("-r"):
+      name = Path(line.split(" ", 1)[1])
+      path = file_path.parent / name
+      subrequirements = parse_requirements(path, seen)
+      requirements.extend(subrequirements)
 
-      # assume standard requirement
-      else:
-        requirements.append(line)
+    # assume standard requirement
+    else:
+      requirements.append(line)
 
   return requirements
 
@@ -6,3 +6,7 @@ from candv import Constants, SimpleConstant
 class CONSTANTS(Constants):
     PRIMARY = SimpleConstant()
     SECONDARY = SimpleConstant()
+    GROUP = SimpleConstant().to_group(
+        group_class=Constants,
+        MEMBER=SimpleConstant(),
+    )
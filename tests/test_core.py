@@ -1,3 +1,4 @@
+import copy
 import pickle
 import sys
 import unittest
@@ -404,7 +405,11 @@ class ConstantsTestCase(unittest.TestCase):
     )
 
   def test_different_imports(self):
-    sys.path.insert(0, str(Path(__file__).absolute().parent / "package"))
+    package_path = str(Path(__file__).absolute().parent / "package")
+
+    if package_path not in sys.path:
+      sys.path.insert(0, package_path)
+      self.addCleanup(sys.path.remove, package_path)
 
     from .package.subpackage.constants import CONSTANTS
     from subpackage.constants import CONSTANTS as SUBCONSTANTS
@@ -418,6 +423,21 @@ class ConstantsTestCase(unittest.TestCase):
     restored = pickle.loads(pickle.dumps(CONSTANTS))
     self.assertEqual(CONSTANTS, restored)
 
+  def test_pickling_constants(self):
+    from .package.subpackage.constants import CONSTANTS
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+      for constant in [CONSTANTS.PRIMARY, CONSTANTS.GROUP, CONSTANTS.GROUP.MEMBER]:
+        restored = pickle.loads(pickle.dumps(constant, protocol))
+        self.assertIs(restored, constant)
+
+  def test_copying_constants(self):
+    from .package.subpackage.constants import CONSTANTS
+
+    for constant in [CONSTANTS.PRIMARY, CONSTANTS.GROUP, CONSTANTS.GROUP.MEMBER]:
+      self.assertIs(copy.copy(constant), constant)
+      self.assertIs(copy.deepcopy(constant), constant)
+
 
 class ConstantClassMixinTestCase(unittest.TestCase):
 
@@ -439,6 +459,20 @@ class ConstantClassMixinTestCase(unittest.TestCase):
       ],
     )
 
+  def test_constant_class_mixin_is_cached(self):
+
+    class CustomConstant(SimpleConstant):
+      pass
+
+    self.assertIs(
+      with_constant_class(CustomConstant),
+      with_constant_class(CustomConstant),
+    )
+    self.assertIsNot(
+      with_constant_class(CustomConstant),
+      with_constant_class(SimpleConstant),
+    )
+
 
 class SimpleConstantTestCase(unittest.TestCase):
 
@@ -463,6 +497,27 @@ class SimpleConstantTestCase(unittest.TestCase):
 
     self.assertEqual(repr(FOO.CONSTANT), "<constant 'FOO.CONSTANT'>")
 
+  def test_full_name_is_read_only(self):
+
+    class FOO(Constants):
+      CONSTANT = SimpleConstant()
+
+    with self.assertRaises(AttributeError):
+      FOO.CONSTANT.full_name = "BAR.CONSTANT"
+
+    self.assertEqual(FOO.CONSTANT.full_name, "FOO.CONSTANT")
+
+  def test_equality(self):
+
+    class FOO(Constants):
+      CONSTANT = SimpleConstant()
+      OTHER = SimpleConstant()
+
+    self.assertEqual(FOO.CONSTANT, FOO.CONSTANT)
+    self.assertNotEqual(FOO.CONSTANT, FOO.OTHER)
+    self.assertNotEqual(FOO.CONSTANT, "FOO.CONSTANT")
+    self.assertIs(FOO.CONSTANT.__eq__("FOO.CONSTANT"), NotImplemented)
+
   def test_container(self):
 
     class FOO(Constants):
@@ -480,6 +535,33 @@ class SimpleConstantTestCase(unittest.TestCase):
       {'name': "CONSTANT"},
     )
 
+  def test_slots(self):
+    constant = SimpleConstant()
+
+    self.assertFalse(hasattr(constant, "__dict__"))
+
+    with self.assertRaises(AttributeError):
+      constant.foo = "bar"
+
+  def test_pickling_unbound(self):
+    constant = SimpleConstant()
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+      restored = pickle.loads(pickle.dumps(constant, protocol))
+      self.assertIsNot(restored, constant)
+      self.assertEqual(restored, constant)
+      self.assertIsNone(restored.container)
+
+  def test_subclass_without_slots(self):
+
+    class CustomConstant(SimpleConstant):
+      pass
+
+    constant = CustomConstant()
+    constant.foo = "bar"
+
+    self.assertEqual(constant.foo, "bar")
+
 
 class GrouppingTestCase(unittest.TestCase):
 
@@ -4,6 +4,7 @@ import unittest
 from collections.abc import Iterator
 
 from datetime import date
+from datetime import datetime
 
 from dataclasses import dataclass
 
@@ -136,6 +137,15 @@ class ValuesTestCase(unittest.TestCase):
       "\"<constants container 'FOO'>\""
     )
 
+  def test_get_by_value_default(self):
+
+    class FOO(Values):
+      ONE = ValueConstant(1)
+
+    self.assertEqual(FOO.get_by_value(1, default=None), FOO.ONE)
+    self.assertIsNone(FOO.get_by_value(2, default=None))
+    self.assertEqual(FOO.get_by_value(2, default=FOO.ONE), FOO.ONE)
+
   def test_get_by_value_with_duplicates(self):
 
     class FOO(Values):
@@ -145,6 +155,55 @@ class ValuesTestCase(unittest.TestCase):
 
     self.assertEqual(FOO.get_by_value(2), FOO.TWO)
 
+  def test_get_by_value_custom_equality(self):
+
+    class Letter:
+
+      def __eq__(self, other):
+        return other == "e"
+
+      __hash__ = object.__hash__
+
+    class FOO(Values):
+      ONE = ValueConstant(1)
+      E = ValueConstant(Letter())
+
+    self.assertEqual(FOO.get_by_value("e"), FOO.E)
+    self.assertEqual(FOO.filter_by_value("e"), [FOO.E, ])
+
+  def test_get_by_value_changed(self):
+
+    class FOO(Values):
+      ONE = ValueConstant(1)
+
+    FOO.ONE.value = 2
+
+    self.assertEqual(FOO.get_by_value(2), FOO.ONE)
+    self.assertEqual(FOO.filter_by_value(2), [FOO.ONE, ])
+    self.assertIsNone(FOO.get_by_value(1, default=None))
+    self.assertEqual(FOO.values(), [2, ])
+    self.assertEqual(list(FOO.itervalues()), [2, ])
+
+  def test_values_computed(self):
+
+    class CounterConstant(ValueConstant):
+
+      @property
+      def value(self):
+        self.counter += 1
+        return self.counter
+
+      @value.setter
+      def value(self, value):
+        self.counter = value
+
+    class FOO(Values):
+      constant_class = CounterConstant
+      ONE = CounterConstant(0)
+
+    self.assertEqual(FOO.values(), [1, ])
+    self.assertEqual(FOO.values(), [2, ])
+
   def test_filter_by_value(self):
 
     class FOO(Values):
@@ -165,6 +224,36 @@ class ValuesTestCase(unittest.TestCase):
       ],
     )
 
+  def test_get_by_value_unhashable(self):
+
+    class FOO(Values):
+      ONE = ValueConstant([1, ])
+      TWO = ValueConstant(2)
+
+    self.assertEqual(FOO.get_by_value([1, ]), FOO.ONE)
+    self.assertEqual(FOO.get_by_value(2), FOO.TWO)
+
+    with self.assertRaises(CandvValueNotFoundError):
+      FOO.get_by_value([2, ])
+
+  def test_filter_by_value_unhashable(self):
+
+    class FOO(Values):
+      ONE = ValueConstant([1, ])
+      TWO = ValueConstant(2)
+      ONE_DUB = ValueConstant([1, ])
+
+    constants = FOO.filter_by_value([1, ])
+    self.assertIsInstance(constants, list)
+    self.assertEqual(
+      list(map(operator.attrgetter("name"), constants)),
+      [
+        "ONE",
+        "ONE_DUB",
+      ],
+    )
+    self.assertEqual(FOO.filter_by_value({}), [])
+
   def test_values(self):
 
     class FOO(Values):
@@ -249,6 +338,19 @@ class ValuesTestCase(unittest.TestCase):
       },
     )
 
+  def test_to_primitive_datetime(self):
+
+    class FOO(Values):
+      DATETIME = ValueConstant(datetime(1999, 12, 31, 23, 59, 59))
+
+    self.assertEqual(
+      FOO.DATETIME.to_primitive(),
+      {
+        'name': "DATETIME",
+        'value': "1999-12-31T23:59:59",
+      },
+    )
+
   def test_group(self):
 
     class FOO(Constants):
@@ -282,6 +384,43 @@ class ValuesTestCase(unittest.TestCase):
 
 class VerboseValueConstantTestCase(unittest.TestCase):
 
+  def test_combined_constant_classes(self):
+
+    class CustomConstant(VerboseConstant, ValueConstant):
+
+      def __init__(self, value, verbose_name=None):
+        ValueConstant.__init__(self, value)
+        self.verbose_name = verbose_name
+        self.help_text = None
+
+    class FOO(Values):
+      constant_class = CustomConstant
+      ONE = CustomConstant(1, "one")
+
+    self.assertEqual(FOO.ONE.value, 1)
+    self.assertEqual(FOO.ONE.verbose_name, "one")
+    self.assertEqual(FOO.get_by_value(1), FOO.ONE)
+
+  def test_cooperative_init(self):
+
+    class CheckedValueConstant(ValueConstant):
+
+      def __init__(self, value):
+        if not isinstance(value, int):
+          raise TypeError("value must be an integer")
+
+        super().__init__(value)
+
+    class CustomConstant(VerboseValueConstant, CheckedValueConstant):
+      pass
+
+    constant = CustomConstant(1, "one")
+    self.assertEqual(constant.value, 1)
+    self.assertEqual(constant.verbose_name, "one")
+
+    with self.assertRaises(TypeError):
+      CustomConstant("x", "n")
+
   def test_group(self):
 
     class FOO(Constants):